@@ -1,14 +1,27 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Query
+from fastapi import FastAPI, HTTPException, Request, UploadFile, Body, File, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
 from google.oauth2.service_account import Credentials
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload, MediaIoBaseDownload
+import certifi
+import httplib2shim
+import httpx
+import urllib3
 from dotenv import load_dotenv
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+import anyio.to_thread
+import orjson
 import os
-import json
 import io
+import random
+import secrets
+import threading
+import time
 from typing import Optional, List
 from datetime import datetime
 
@@ -17,9 +30,17 @@ load_dotenv()
 app = FastAPI(
     title="Google Drive Storage API",
     description="Complete REST API for Google Drive file management",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+@app.on_event("startup")
+async def configure_threadpool():
+    # Blocking Drive SDK calls run on the anyio worker threadpool; the
+    # default of 40 tokens caps concurrency, so make it configurable
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", "64"))
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -29,58 +50,238 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Google Drive client
+# Google Drive client, built once and reused across requests so the
+# authorized HTTP session (TLS connection + OAuth token) is shared
+_credentials_lock = threading.Lock()
+_service_lock = threading.Lock()
+_service = None
+
+DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
+
+# Discovery document shipped with the app so building the service never
+# touches the network or the on-disk discovery cache
+DISCOVERY_DOC_PATH = os.path.join(os.path.dirname(__file__), "drive_v3.json")
+
+# Parse the service-account key exactly once, at import, so a bad or
+# missing GOOGLE_CREDENTIALS fails at startup rather than on the first
+# request (loading the RSA key is not free either)
+_creds_json = os.getenv("GOOGLE_CREDENTIALS")
+if not _creds_json:
+    raise RuntimeError("GOOGLE_CREDENTIALS not found in environment variables")
+_credentials = Credentials.from_service_account_info(orjson.loads(_creds_json), scopes=DRIVE_SCOPES)
+del _creds_json
+
+def get_credentials():
+    return _credentials
+
 def get_drive_service():
-    try:
-        creds_json = os.getenv("GOOGLE_CREDENTIALS")
-        if not creds_json:
-            raise ValueError("GOOGLE_CREDENTIALS not found in environment variables")
-        
-        creds_dict = json.loads(creds_json)
-        credentials = Credentials.from_service_account_info(creds_dict)
-        service = build('drive', 'v3', credentials=credentials)
-        return service
-    except Exception as e:
-        print(f"Error initializing Drive service: {str(e)}")
-        raise
+    global _service
+    if _service is not None:
+        return _service
+    with _service_lock:
+        if _service is not None:
+            return _service
+        try:
+            credentials = get_credentials()
+            # httplib2shim backs httplib2 with a urllib3 connection pool,
+            # making the shared client thread-safe and reusing TCP+TLS
+            # sessions instead of handshaking on every call. The pool is
+            # built explicitly because the shim's default factory breaks
+            # on Python 3.10+ (collections.Callable)
+            pool = urllib3.PoolManager(
+                maxsize=int(os.getenv("DRIVE_POOL_MAXSIZE", "64")),
+                cert_reqs='CERT_REQUIRED',
+                ca_certs=certifi.where()
+            )
+            authorized_http = AuthorizedHttp(credentials, http=httplib2shim.Http(pool=pool))
+            if os.path.exists(DISCOVERY_DOC_PATH):
+                with open(DISCOVERY_DOC_PATH) as f:
+                    _service = build_from_document(f.read(), http=authorized_http)
+            else:
+                _service = build(
+                    'drive', 'v3',
+                    http=authorized_http,
+                    cache_discovery=False,
+                    static_discovery=True
+                )
+            return _service
+        except Exception as e:
+            print(f"Error initializing Drive service: {str(e)}")
+            raise
+
+# Client-side throttling: cap in-flight Drive calls and smooth bursts
+# so incoming request spikes do not translate into 429 storms
+_drive_semaphore = anyio.Semaphore(int(os.getenv("DRIVE_MAX_CONCURRENCY", "32")))
+_drive_rate_limiter = AsyncLimiter(
+    max_rate=float(os.getenv("DRIVE_RATE_LIMIT", "10")),
+    time_period=1
+)
+
+# Drive returns transient 429/5xx responses routinely; retry them with
+# exponential backoff instead of surfacing them as HTTP 500
+_RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None,
+                   base_delay: float = 1.0, max_delay: float = 32.0) -> float:
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, 1)
+
+async def execute_with_retry(request, max_attempts: int = 5):
+    for attempt in range(max_attempts):
+        try:
+            async with _drive_semaphore, _drive_rate_limiter:
+                return await anyio.to_thread.run_sync(request.execute)
+        except HttpError as e:
+            status = e.resp.status if e.resp is not None else None
+            if status not in _RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+            await anyio.sleep(_backoff_delay(attempt, e.resp.get('retry-after')))
+
+# Metadata calls go straight to the Drive REST API over a shared
+# HTTP/2 client, multiplexing on the event loop without a thread hop.
+# The synchronous service above remains for media up/downloads, which
+# googleapiclient's chunked helpers handle
+DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
+DRIVE_UPLOAD_BASE = "https://www.googleapis.com/upload/drive/v3"
+
+_async_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30
+)
+
+def _get_access_token():
+    # Refresh the service-account token only when it is missing or
+    # within 60s of expiry; otherwise reuse the cached one
+    credentials = get_credentials()
+    with _credentials_lock:
+        if not credentials.valid or (
+            credentials.expiry and
+            (credentials.expiry - datetime.utcnow()).total_seconds() < 60
+        ):
+            credentials.refresh(GoogleAuthRequest())
+        return credentials.token
+
+async def drive_api_request(method: str, path: str, max_attempts: int = 5, **kwargs) -> httpx.Response:
+    token = await anyio.to_thread.run_sync(_get_access_token)
+    headers = kwargs.pop('headers', {})
+    headers['Authorization'] = f"Bearer {token}"
+
+    for attempt in range(max_attempts):
+        async with _drive_semaphore, _drive_rate_limiter:
+            response = await _async_client.request(
+                method, DRIVE_API_BASE + path, headers=headers, **kwargs
+            )
+        if response.status_code in _RETRYABLE_STATUSES and attempt < max_attempts - 1:
+            await anyio.sleep(_backoff_delay(attempt, response.headers.get('retry-after')))
+            continue
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get('error', {}).get('message', response.text)
+            except ValueError:
+                detail = response.text
+            raise HTTPException(status_code=response.status_code, detail=detail)
+        return response
+
+def escape_query_term(value: str) -> str:
+    # Drive query strings are single-quoted; escape backslashes and
+    # quotes so user input cannot break out of the literal
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+# Repeated searches (autocomplete, dashboards) are common; memoize
+# responses briefly so they skip the Drive API entirely
+_search_cache = TTLCache(maxsize=512, ttl=15)
+_search_cache_lock = threading.Lock()
+
+# File metadata rarely changes between repeated accesses of the same
+# file_id, so a short TTL cache saves a Drive round trip per hit
+_meta_cache = TTLCache(maxsize=4096, ttl=60)
+_meta_cache_lock = threading.Lock()
+
+async def fetch_file_metadata(file_id: str, fields: str):
+    cache_key = (file_id, fields)
+    with _meta_cache_lock:
+        cached = _meta_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    response = await drive_api_request('GET', f'/files/{file_id}', params={'fields': fields})
+    file_info = response.json()
+    with _meta_cache_lock:
+        _meta_cache[cache_key] = file_info
+    return file_info
+
+def invalidate_file_metadata(file_id: str):
+    with _meta_cache_lock:
+        for key in [k for k in _meta_cache if k[0] == file_id]:
+            _meta_cache.pop(key, None)
+
+# Authenticate API request; the expected key is read once at import and
+# compared in constant time to avoid a timing side-channel
+_API_KEY = os.getenv("API_KEY", "").encode()
 
-# Authenticate API request
 def verify_api_key(api_key: str):
-    valid_key = os.getenv("API_KEY")
-    if api_key != valid_key:
+    if not _API_KEY or not secrets.compare_digest(api_key.encode(), _API_KEY):
         raise HTTPException(status_code=401, detail="Invalid API Key")
 
+# Static payload built once at import; the handler just returns it
+_ROOT_RESPONSE = {
+    "message": "Google Drive Storage API",
+    "version": "1.0.0",
+    "endpoints": {
+        "list": "/files?api_key=YOUR_API_KEY",
+        "upload": "POST /upload?api_key=YOUR_API_KEY",
+        "download": "/download/{file_id}?api_key=YOUR_API_KEY",
+        "delete": "DELETE /files/{file_id}?api_key=YOUR_API_KEY",
+        "info": "/files/{file_id}?api_key=YOUR_API_KEY"
+    }
+}
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Google Drive Storage API",
-        "version": "1.0.0",
-        "endpoints": {
-            "list": "/files?api_key=YOUR_API_KEY",
-            "upload": "POST /upload?api_key=YOUR_API_KEY",
-            "download": "/download/{file_id}?api_key=YOUR_API_KEY",
-            "delete": "DELETE /files/{file_id}?api_key=YOUR_API_KEY",
-            "info": "/files/{file_id}?api_key=YOUR_API_KEY"
-        }
-    }
+    return _ROOT_RESPONSE
+
+# Smaller field selections mean less Drive payload per call; 'owners'
+# in particular expands to a full user object per file, so it is only
+# included when the caller asks for the full set
+_LIST_FIELD_SETS = {
+    'minimal': 'files(id, name, mimeType)',
+    'default': 'files(id, name, mimeType, createdTime, modifiedTime, size, webViewLink)',
+    'full': 'files(id, name, mimeType, createdTime, modifiedTime, size, owners, webViewLink, permissions)'
+}
+_INFO_FIELD_SETS = {
+    'minimal': 'id, name, mimeType',
+    'default': 'id, name, mimeType, createdTime, modifiedTime, size, webViewLink, parents, description',
+    'full': 'id, name, mimeType, createdTime, modifiedTime, size, owners, webViewLink, parents, description, permissions'
+}
+
+def _resolve_field_set(field_sets, fields: str) -> str:
+    if fields not in field_sets:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fields must be one of: {', '.join(field_sets)}"
+        )
+    return field_sets[fields]
 
 @app.get("/files")
-async def list_files(api_key: str = Query(...), folder_id: Optional[str] = None, limit: int = 10):
+async def list_files(api_key: str = Query(...), folder_id: Optional[str] = None, limit: int = 10, fields: str = 'default'):
     """List all files in Google Drive"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
+        field_selection = _resolve_field_set(_LIST_FIELD_SETS, fields)
+
         query = "trashed=false"
         if folder_id:
-            query += f" and '{folder_id}' in parents"
-        
-        results = service.files().list(
-            q=query,
-            spaces='drive',
-            fields='files(id, name, mimeType, createdTime, modifiedTime, size, owners, webViewLink)',
-            pageSize=limit
-        ).execute()
+            query += f" and '{escape_query_term(folder_id)}' in parents"
+
+        response = await drive_api_request('GET', '/files', params={
+            'q': query,
+            'spaces': 'drive',
+            'fields': field_selection,
+            'pageSize': limit
+        })
+        results = response.json()
         
         files = results.get('files', [])
         return {
@@ -94,16 +295,13 @@ async def list_files(api_key: str = Query(...), folder_id: Optional[str] = None,
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/files/{file_id}")
-async def get_file_info(file_id: str, api_key: str = Query(...)):
+async def get_file_info(file_id: str, api_key: str = Query(...), fields: str = 'default'):
     """Get file information"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
-        file_info = service.files().get(
-            fileId=file_id,
-            fields='id, name, mimeType, createdTime, modifiedTime, size, owners, webViewLink, parents, description'
-        ).execute()
+        field_selection = _resolve_field_set(_INFO_FIELD_SETS, fields)
+
+        file_info = await fetch_file_metadata(file_id, fields=field_selection)
         
         return {
             "status": "success",
@@ -125,20 +323,21 @@ async def upload_file(file: UploadFile = File(...), api_key: str = Query(...), f
         if folder_id:
             file_metadata['parents'] = [folder_id]
         
-        content = await file.read()
-        file_obj = io.BytesIO(content)
-        
-        media = MediaFileUpload(
-            io.BytesIO(content),
-            mimetype=file.content_type,
+        # Stream straight from the UploadFile's spooled temp file in 1 MB
+        # resumable chunks instead of reading the whole upload into memory
+        media = MediaIoBaseUpload(
+            file.file,
+            mimetype=file.content_type or 'application/octet-stream',
+            chunksize=1024 * 1024,
             resumable=True
         )
-        
-        file_result = service.files().create(
+
+        request = service.files().create(
             body=file_metadata,
             media_body=media,
             fields='id, name, webViewLink'
-        ).execute()
+        )
+        file_result = await execute_with_retry(request)
         
         return {
             "status": "success",
@@ -150,29 +349,113 @@ async def upload_file(file: UploadFile = File(...), api_key: str = Query(...), f
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Resumable upload chunks must be multiples of 256 KiB except the last
+_STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+@app.post("/upload/stream")
+async def upload_file_stream(request: Request, filename: str = Query(...), api_key: str = Query(...), folder_id: Optional[str] = None):
+    """Upload a file by streaming the raw request body straight to Drive"""
+    try:
+        verify_api_key(api_key)
+
+        token = await anyio.to_thread.run_sync(_get_access_token)
+        content_type = request.headers.get('content-type', 'application/octet-stream')
+
+        file_metadata = {'name': filename}
+        if folder_id:
+            file_metadata['parents'] = [folder_id]
+
+        # Open a resumable upload session; Drive hands back a session URI
+        init_response = await _async_client.post(
+            f"{DRIVE_UPLOAD_BASE}/files",
+            params={'uploadType': 'resumable', 'fields': 'id, name, webViewLink'},
+            headers={
+                'Authorization': f"Bearer {token}",
+                'X-Upload-Content-Type': content_type
+            },
+            json=file_metadata
+        )
+        if init_response.status_code >= 400:
+            raise HTTPException(status_code=init_response.status_code, detail=init_response.text)
+        session_uri = init_response.headers['location']
+
+        # Forward body chunks as they arrive from the client; nothing is
+        # spooled to disk and at most one chunk is held in memory
+        offset = 0
+        buffer = bytearray()
+        async for chunk in request.stream():
+            buffer.extend(chunk)
+            while len(buffer) >= _STREAM_CHUNK_SIZE:
+                part = bytes(buffer[:_STREAM_CHUNK_SIZE])
+                del buffer[:_STREAM_CHUNK_SIZE]
+                put_response = await _async_client.put(
+                    session_uri,
+                    content=part,
+                    headers={'Content-Range': f"bytes {offset}-{offset + len(part) - 1}/*"}
+                )
+                if put_response.status_code not in (200, 201, 308):
+                    raise HTTPException(status_code=put_response.status_code, detail=put_response.text)
+                offset += len(part)
+
+        total = offset + len(buffer)
+        if buffer:
+            content_range = f"bytes {offset}-{total - 1}/{total}"
+        else:
+            content_range = f"bytes */{total}"
+        final_response = await _async_client.put(
+            session_uri,
+            content=bytes(buffer),
+            headers={'Content-Range': content_range}
+        )
+        if final_response.status_code >= 400:
+            raise HTTPException(status_code=final_response.status_code, detail=final_response.text)
+
+        return {
+            "status": "success",
+            "message": "File uploaded successfully",
+            "file": final_response.json()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/download/{file_id}")
-async def download_file(file_id: str, api_key: str = Query(...)):
+async def download_file(file_id: str, api_key: str = Query(...), proxy: bool = False):
     """Download a file from Google Drive"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
-        file_info = service.files().get(fileId=file_id, fields='name, mimeType').execute()
+
+        file_info = await fetch_file_metadata(file_id, fields='name, mimeType, webContentLink')
         file_name = file_info.get('name')
-        
+
+        # Redirect the client to Drive's own download URL so the bytes
+        # never pass through this server; ?proxy=1 keeps the old
+        # pass-through streaming for clients that cannot follow Drive
+        link = file_info.get('webContentLink')
+        if link and not proxy:
+            return RedirectResponse(url=link, status_code=302)
+
+        service = get_drive_service()
+
         request = service.files().get_media(fileId=file_id)
-        file_obj = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_obj, request)
-        
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-        
-        file_obj.seek(0)
-        return FileResponse(
-            file_obj,
+
+        async def stream_chunks():
+            # Yield each 4 MB chunk as it arrives from Drive instead of
+            # buffering the whole file before responding
+            buffer = io.BytesIO()
+            downloader = MediaIoBaseDownload(buffer, request, chunksize=4 * 1024 * 1024)
+            done = False
+            while not done:
+                status, done = await anyio.to_thread.run_sync(downloader.next_chunk)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+
+        return StreamingResponse(
+            stream_chunks(),
             media_type=file_info.get('mimeType', 'application/octet-stream'),
-            filename=file_name
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
         )
     except HTTPException:
         raise
@@ -184,9 +467,9 @@ async def delete_file(file_id: str, api_key: str = Query(...)):
     """Delete a file from Google Drive"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
-        service.files().delete(fileId=file_id).execute()
+
+        await drive_api_request('DELETE', f'/files/{file_id}')
+        invalidate_file_metadata(file_id)
         
         return {
             "status": "success",
@@ -197,22 +480,103 @@ async def delete_file(file_id: str, api_key: str = Query(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Drive allows up to 100 sub-requests per batch call
+_BATCH_LIMIT = 100
+
+async def run_drive_batch(service, requests_by_id):
+    """Pack several Drive calls into one batch HTTP round trip."""
+    results = {}
+
+    def record(request_id, response, exception):
+        if exception is not None:
+            status = getattr(getattr(exception, 'resp', None), 'status', None)
+            results[request_id] = {"status": "error", "code": status, "detail": str(exception)}
+        else:
+            results[request_id] = {"status": "success", "response": response}
+
+    batch = service.new_batch_http_request(callback=record)
+    for request_id, request in requests_by_id.items():
+        batch.add(request, request_id=request_id)
+
+    async with _drive_semaphore, _drive_rate_limiter:
+        await anyio.to_thread.run_sync(batch.execute)
+    return results
+
+@app.post("/files/batch-delete")
+async def batch_delete_files(file_ids: List[str] = Body(...), api_key: str = Query(...)):
+    """Delete several files in a single Drive round trip"""
+    try:
+        verify_api_key(api_key)
+        if len(file_ids) > _BATCH_LIMIT:
+            raise HTTPException(status_code=400, detail=f"At most {_BATCH_LIMIT} file ids per batch")
+        service = get_drive_service()
+
+        requests_by_id = {fid: service.files().delete(fileId=fid) for fid in file_ids}
+        results = await run_drive_batch(service, requests_by_id)
+        for fid in file_ids:
+            invalidate_file_metadata(fid)
+
+        return {
+            "status": "success",
+            "count": len(file_ids),
+            "results": {fid: {k: v for k, v in r.items() if k != 'response'} for fid, r in results.items()}
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/files/batch-info")
+async def batch_get_file_info(file_ids: List[str] = Body(...), api_key: str = Query(...)):
+    """Fetch metadata for several files in a single Drive round trip"""
+    try:
+        verify_api_key(api_key)
+        if len(file_ids) > _BATCH_LIMIT:
+            raise HTTPException(status_code=400, detail=f"At most {_BATCH_LIMIT} file ids per batch")
+        service = get_drive_service()
+
+        requests_by_id = {
+            fid: service.files().get(
+                fileId=fid,
+                fields='id, name, mimeType, createdTime, modifiedTime, size, webViewLink'
+            )
+            for fid in file_ids
+        }
+        results = await run_drive_batch(service, requests_by_id)
+
+        files = {}
+        for fid, result in results.items():
+            if result["status"] == "success":
+                files[fid] = {"status": "success", "file": result["response"]}
+            else:
+                files[fid] = result
+        return {
+            "status": "success",
+            "count": len(file_ids),
+            "files": files
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.put("/files/{file_id}")
 async def update_file(file_id: str, name: Optional[str] = None, api_key: str = Query(...)):
     """Update file metadata (like rename)"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
+
         file_metadata = {}
         if name:
             file_metadata['name'] = name
-        
-        updated_file = service.files().update(
-            fileId=file_id,
-            body=file_metadata,
-            fields='id, name, modifiedTime'
-        ).execute()
+
+        response = await drive_api_request(
+            'PATCH', f'/files/{file_id}',
+            params={'fields': 'id, name, modifiedTime'},
+            json=file_metadata
+        )
+        updated_file = response.json()
+        invalidate_file_metadata(file_id)
         
         return {
             "status": "success",
@@ -229,19 +593,20 @@ async def create_folder(folder_name: str = Query(...), api_key: str = Query(...)
     """Create a folder in Google Drive"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
+
         folder_metadata = {
             'name': folder_name,
             'mimeType': 'application/vnd.google-apps.folder'
         }
         if parent_id:
             folder_metadata['parents'] = [parent_id]
-        
-        folder = service.files().create(
-            body=folder_metadata,
-            fields='id, name'
-        ).execute()
+
+        response = await drive_api_request(
+            'POST', '/files',
+            params={'fields': 'id, name'},
+            json=folder_metadata
+        )
+        folder = response.json()
         
         return {
             "status": "success",
@@ -258,15 +623,23 @@ async def search_files(q: str = Query(...), api_key: str = Query(...), limit: in
     """Search for files in Google Drive"""
     try:
         verify_api_key(api_key)
-        service = get_drive_service()
-        
-        results = service.files().list(
-            q=f"name contains '{q}' and trashed=false",
-            spaces='drive',
-            fields='files(id, name, mimeType, createdTime)',
-            pageSize=limit
-        ).execute()
-        
+
+        q_escaped = escape_query_term(q)
+        cache_key = (q_escaped, limit)
+        with _search_cache_lock:
+            results = _search_cache.get(cache_key)
+
+        if results is None:
+            response = await drive_api_request('GET', '/files', params={
+                'q': f"name contains '{q_escaped}' and trashed=false",
+                'spaces': 'drive',
+                'fields': 'files(id, name, mimeType, createdTime)',
+                'pageSize': limit
+            })
+            results = response.json()
+            with _search_cache_lock:
+                _search_cache[cache_key] = results
+
         files = results.get('files', [])
         return {
             "status": "success",
@@ -281,8 +654,18 @@ async def search_files(q: str = Query(...), api_key: str = Query(...), limit: in
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # Polled by load balancers at high frequency; a plain epoch float is
+    # cheaper than constructing and formatting a datetime per probe
+    return {"status": "healthy", "timestamp": time.time()}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WORKERS", "4")),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
+    )